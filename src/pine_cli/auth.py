@@ -1,14 +1,10 @@
 """pine auth login|request|verify|status|logout — shared authentication for Voice & Assistant."""
 
-import json
 from typing import Optional
 
 import click
-from rich.console import Console
 
-from pine_cli.config import load_config, save_config, run_async, handle_api_errors
-
-console = Console()
+from pine_cli.config import console, dumps, load_config, make_assistant_client, save_config, update_config, run_async, handle_api_errors
 
 
 @click.group()
@@ -21,12 +17,11 @@ def auth():
 @handle_api_errors
 def login(base_url: Optional[str]):
     """Log in with email verification (interactive)."""
-    from pine_assistant.client import AsyncPineAI
+    cfg = load_config()
+    url = base_url or cfg.get("base_url", "https://www.19pine.ai")
 
     async def _login():
-        cfg = load_config()
-        url = base_url or cfg.get("base_url", "https://www.19pine.ai")
-        client = AsyncPineAI(base_url=url)
+        client = make_assistant_client(url)
 
         email = click.prompt("Email")
         with console.status("Sending verification code…"):
@@ -37,14 +32,9 @@ def login(base_url: Optional[str]):
         with console.status("Verifying…"):
             verify = await client.auth.verify_code(email, code, result["request_token"])
 
-        save_config({
-            **cfg,
-            "access_token": verify["access_token"],
-            "user_id": verify["id"],
-            "email": verify["email"],
-            "base_url": url,
-        })
-        console.print(f"[green]✓ Logged in as {verify['email']}[/green]  (user {verify['id']})")
+        verified_email, user_id = verify["email"], verify["id"]
+        update_config(access_token=verify["access_token"], user_id=user_id, email=verified_email, base_url=url)
+        console.print(f"[green]✓ Logged in as {verified_email}[/green]  (user {user_id})")
         console.print("[dim]Credentials saved to ~/.pine/config.json[/dim]")
 
     run_async(_login())
@@ -56,14 +46,13 @@ def login(base_url: Optional[str]):
 @handle_api_errors
 def request_code(email: str, base_url: Optional[str]):
     """Request a verification code (non-interactive)."""
-    from pine_assistant.client import AsyncPineAI
+    cfg = load_config()
+    url = base_url or cfg.get("base_url", "https://www.19pine.ai")
 
     async def _request():
-        cfg = load_config()
-        url = base_url or cfg.get("base_url", "https://www.19pine.ai")
-        client = AsyncPineAI(base_url=url)
+        client = make_assistant_client(url)
         result = await client.auth.request_code(email)
-        click.echo(json.dumps({"request_token": result["request_token"], "email": email}))
+        click.echo(dumps({"request_token": result["request_token"], "email": email}))
 
     run_async(_request())
 
@@ -76,22 +65,16 @@ def request_code(email: str, base_url: Optional[str]):
 @handle_api_errors
 def verify_code(email: str, request_token: str, code: str, base_url: Optional[str]):
     """Verify code and save credentials (non-interactive)."""
-    from pine_assistant.client import AsyncPineAI
+    cfg = load_config()
+    url = base_url or cfg.get("base_url", "https://www.19pine.ai")
 
     async def _verify():
-        cfg = load_config()
-        url = base_url or cfg.get("base_url", "https://www.19pine.ai")
-        client = AsyncPineAI(base_url=url)
+        client = make_assistant_client(url)
         verify = await client.auth.verify_code(email, code, request_token)
 
-        save_config({
-            **cfg,
-            "access_token": verify["access_token"],
-            "user_id": verify["id"],
-            "email": verify["email"],
-            "base_url": url,
-        })
-        click.echo(json.dumps({"status": "authenticated", "email": verify["email"], "user_id": verify["id"]}))
+        verified_email, user_id = verify["email"], verify["id"]
+        update_config(access_token=verify["access_token"], user_id=user_id, email=verified_email, base_url=url)
+        click.echo(dumps({"status": "authenticated", "email": verified_email, "user_id": user_id}))
 
     run_async(_verify())
 
@@ -101,17 +84,20 @@ def verify_code(email: str, request_token: str, code: str, base_url: Optional[st
 def status(json_output: bool):
     """Show current authentication status."""
     cfg = load_config()
+    token = cfg.get("access_token")
+    email = cfg.get("email")
+    user_id = cfg.get("user_id")
+    url = cfg.get("base_url", "https://www.19pine.ai")
     if json_output:
-        authenticated = bool(cfg.get("access_token"))
-        click.echo(json.dumps({
-            "authenticated": authenticated,
-            "email": cfg.get("email"),
-            "user_id": cfg.get("user_id"),
-            "base_url": cfg.get("base_url", "https://www.19pine.ai"),
+        click.echo(dumps({
+            "authenticated": bool(token),
+            "email": email,
+            "user_id": user_id,
+            "base_url": url,
         }))
-    elif cfg.get("access_token"):
-        console.print(f"[green]● Logged in[/green]  {cfg.get('email', '?')}  (user {cfg.get('user_id', '?')})")
-        console.print(f"[dim]Base URL: {cfg.get('base_url', 'https://www.19pine.ai')}[/dim]")
+    elif token:
+        console.print(f"[green]● Logged in[/green]  {email or '?'}  (user {user_id or '?'})")
+        console.print(f"[dim]Base URL: {url}[/dim]")
     else:
         console.print("[yellow]○ Not logged in.[/yellow]  Run [bold]pine auth login[/bold].")
 
@@ -0,0 +1,66 @@
+"""Run several pine commands in one process.
+
+Commands run one after another on the shared event loop and reuse the cached
+SDK clients, so a script of N commands pays for Python startup, imports and
+connection setup once instead of N times::
+
+    from pine_cli.batch import run
+    run(["sessions list --json", "sessions get abc123 --json"])
+
+or from a shell, one command per line::
+
+    python -m pine_cli.batch < commands.txt
+
+Interactive commands (``pine chat``, ``pine auth login``) read stdin and are not
+meant to be batched from it.
+"""
+
+import shlex
+import sys
+from collections.abc import Iterable
+
+import click
+
+
+def run_one(args: list[str]) -> int:
+    """Run one pine command line (without the leading ``pine``); return its exit code."""
+    from pine_cli.main import main
+
+    try:
+        main.main(args, prog_name="pine", standalone_mode=False)
+    except click.exceptions.Exit as exc:
+        return exc.exit_code
+    except click.ClickException as exc:
+        exc.show()
+        return exc.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 1
+    return 0
+
+
+def run(commands: Iterable[str]) -> list[int]:
+    """Run each command line in order and return their exit codes.
+
+    Blank lines and ``#`` comments are skipped; a leading ``pine`` is optional.
+    A line that cannot be parsed is reported on stderr and gets exit code 2.
+    """
+    codes = []
+    for line in commands:
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as exc:  # e.g. an unbalanced quote
+            click.echo(f"pine batch: cannot parse {line.rstrip()!r}: {exc}", err=True)
+            codes.append(2)
+            continue
+        if args[:1] == ["pine"]:
+            args = args[1:]
+        if args:
+            codes.append(run_one(args))
+    return codes
+
+
+if __name__ == "__main__":
+    sys.exit(max(run(sys.stdin), default=0))
@@ -1,20 +1,19 @@
 """pine chat / pine send — interactive and one-shot messaging."""
 
 import asyncio
-import json
+import functools
+import os
 import signal
+import sys
+from contextlib import suppress
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.padding import Padding
-from rich.panel import Panel
+from rich.text import Text
 
 from pine_assistant.models.events import S2CEvent
-from pine_cli.config import get_assistant_client, run_async, handle_api_errors, format_timestamp
-
-console = Console()
+from pine_cli.config import connect_alongside, console, dumps, emit_json, get_assistant_client, leave_and_flush, run_async, handle_api_errors, format_timestamp
 
 
 def _is_stale(event, cutoff) -> bool:
@@ -34,8 +33,10 @@ def _is_stale(event, cutoff) -> bool:
 
 @click.command("chat")
 @click.argument("session_id", required=False)
+@click.option("--history", "history_limit", default=20, type=click.IntRange(min=0),
+              help="Past messages to show on start (default: 20, 0 to skip)")
 @handle_api_errors
-def chat_cmd(session_id: Optional[str]):
+def chat_cmd(session_id: Optional[str], history_limit: int):
     """Interactive chat with Pine AI (REPL).
 
     Optionally pass a SESSION_ID to resume. Without one, shows recent
@@ -50,17 +51,21 @@ def chat_cmd(session_id: Optional[str]):
             if not sid:
                 return
 
-        await client.connect()
+        if not client.connected:
+            await client.connect()
         console.print(f"[dim]Session: {sid}[/dim]")
         await client.join_session(sid)
 
-        with console.status("Loading history…"):
-            history = await client.get_history(sid, max_messages=20, order="asc")
-        messages = history.get("messages", [])
+        messages = []
+        if history_limit:
+            with console.status("Loading history…"):
+                history = await client.get_history(sid, max_messages=history_limit, order="asc")
+            messages = history.get("messages", [])
         if messages:
             console.print(f"[dim]─── last {len(messages)} messages ───[/dim]")
-            for msg in messages:
-                _print_history_message(msg)
+            from rich.console import Group
+
+            console.print(Group(*(row for msg in messages for row in _render_history_message(msg))))
             console.print(f"[dim]─── end of history ───[/dim]\n")
 
         console.print("[cyan]Type your message (Ctrl+C or /quit to exit)[/cyan]\n")
@@ -81,10 +86,20 @@ def chat_cmd(session_id: Optional[str]):
 
         bg = asyncio.create_task(_bg_listener())
         loop = asyncio.get_running_loop()
+        reader = _get_stdin_reader()
+        input_task: Optional[asyncio.Task] = None
+
+        def _on_sigint():
+            # Ctrl+C at the prompt ends the REPL; anywhere else it interrupts as usual.
+            if input_task is not None and not input_task.done():
+                input_task.cancel()
+            else:
+                raise KeyboardInterrupt
+
+        loop.add_signal_handler(signal.SIGINT, _on_sigint)
         try:
             while True:
-                input_task = loop.create_task(asyncio.to_thread(input, "You: "))
-                loop.add_signal_handler(signal.SIGINT, input_task.cancel)
+                input_task = loop.create_task(reader.readline("You: "))
                 try:
                     msg = await input_task
                 except asyncio.CancelledError:
@@ -93,8 +108,6 @@ def chat_cmd(session_id: Optional[str]):
                 except EOFError:
                     console.print()
                     break
-                finally:
-                    loop.remove_signal_handler(signal.SIGINT)
 
                 if msg.strip().lower() in ("/quit", "/exit"):
                     break
@@ -110,34 +123,53 @@ def chat_cmd(session_id: Optional[str]):
                 printer.flush()
                 client.send_message(sid, msg)
         finally:
+            loop.remove_signal_handler(signal.SIGINT)
             bg.cancel()
             try:
                 await bg
             except asyncio.CancelledError:
                 pass
             printer.flush()
-            try:
-                client.leave_session(sid)
-                await asyncio.sleep(1)
-            except (asyncio.CancelledError, Exception):
-                pass
+            with suppress(asyncio.CancelledError, Exception):
+                await leave_and_flush(client, sid)
             await client.disconnect()
 
     run_async(_chat())
 
 
+def _check_message_source(fn):
+    """Require exactly one of MESSAGE and --batch, as a click usage error (exit 2).
+
+    Applied outside handle_api_errors, which would turn it into a plain error.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        ctx = click.get_current_context()
+        if kwargs["batch"] and kwargs["message"] is not None:
+            raise click.UsageError("Cannot use MESSAGE with --batch; messages are read from stdin.", ctx=ctx)
+        if not kwargs["batch"] and kwargs["message"] is None:
+            raise click.MissingParameter(ctx=ctx, param_hint="'MESSAGE'", param_type="argument")
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
 @click.command("send")
-@click.argument("message")
+@click.argument("message", required=False)
 @click.option("-s", "--session", "session_id", default=None, help="Session ID to send the message to")
 @click.option("--new", "create_new", is_flag=True, help="Create a new session, then send")
 @click.option("--no-wait", "no_wait", is_flag=True, help="Fire-and-forget: send without waiting for response")
+@click.option("--batch", is_flag=True, help="Send each line of stdin as a message over one connection")
 @click.option("--json-output", "--json", is_flag=True, help="Output as JSON")
+@_check_message_source
 @handle_api_errors
-def send_cmd(message: str, session_id: Optional[str], create_new: bool, no_wait: bool, json_output: bool):
+def send_cmd(message: Optional[str], session_id: Optional[str], create_new: bool, no_wait: bool, batch: bool,
+             json_output: bool):
     """Send a message to a Pine AI session.
 
     Requires either --session/-s to target an existing session,
-    or --new to create a fresh session first.
+    or --new to create a fresh session first. With --batch, messages are
+    read from stdin (one per line) instead of the MESSAGE argument.
     """
     if not session_id and not create_new:
         raise click.UsageError("Provide --session/-s SESSION_ID or --new to create one.")
@@ -149,50 +181,68 @@ def send_cmd(message: str, session_id: Optional[str], create_new: bool, no_wait:
 
         sid = session_id
         if create_new:
-            s = await client.sessions.create()
-            sid = s["id"]
+            sid = await _create_and_connect(client)
             if json_output:
-                click.echo(json.dumps({"type": "session_created", "data": {"session_id": sid}}))
+                emit_json({"type": "session_created", "data": {"session_id": sid}})
             else:
                 console.print(f"[green]✓ Session created:[/green]  [bold]{sid}[/bold]")
+        else:
+            await client.connect()
 
-        await client.connect()
-        try:
-            await client.join_session(sid)
-
+        async def _deliver(text: str):
             if no_wait:
-                client.send_message(sid, message)
+                client.send_message(sid, text)
                 if json_output:
-                    click.echo(json.dumps({"type": "message_sent", "data": {"session_id": sid}}))
+                    emit_json({"type": "message_sent", "data": {"session_id": sid}})
                 else:
                     console.print("[green]✓ Message sent.[/green]")
             else:
                 printer = _StreamPrinter()
-                async for event in client.chat(sid, message):
+                async for event in client.chat(sid, text):
                     if json_output:
-                        click.echo(json.dumps({"type": event.type, "data": event.data}))
+                        emit_json({"type": event.type, "data": event.data})
                     else:
                         printer.feed(event)
                 printer.flush()
 
-            client.leave_session(sid)
-            if no_wait:
-                await asyncio.sleep(1)
+        try:
+            await client.join_session(sid)
+
+            if batch:
+                async for text in _read_stdin_messages():
+                    await _deliver(text)
+            else:
+                await _deliver(message)
+
+            await leave_and_flush(client, sid)
         finally:
             await client.disconnect()
 
     run_async(_send())
 
 
+async def _create_and_connect(client) -> str:
+    """Create a session while the WebSocket connects; return the new session ID."""
+    session = await connect_alongside(client, client.sessions.create())
+    return session["id"]
+
+
 async def _pick_or_create_session(client) -> Optional[str]:
-    """Show recent sessions and let the user pick one or create a new session."""
+    """Show recent sessions and let the user pick one or create a new session.
+
+    Creating a new session also connects the client.
+    """
     page_size = 10
-    offset = 0
     all_items: list = []
+    prefetch: Optional[asyncio.Task] = None
 
     while True:
         with console.status("Fetching sessions…"):
-            result = await client.sessions.list(limit=page_size, offset=offset)
+            if prefetch is not None:
+                result = await prefetch
+            else:
+                result = await client.sessions.list(limit=page_size, offset=0)
+        prefetch = None
 
         page = result.get("sessions", [])
         total = result.get("total", 0)
@@ -212,19 +262,23 @@ async def _pick_or_create_session(client) -> Optional[str]:
             if has_more:
                 console.print(f"  [bold]m.[/bold] Show more  [dim]({len(all_items)} of {total})[/dim]")
             console.print()
-            choice = click.prompt("Select a session (number, 'n', or 'm')" if has_more
-                                  else "Select a session (number or 'n')", default="1")
+            if has_more:
+                # Fetch the next page while the user is reading this one.
+                prefetch = asyncio.create_task(client.sessions.list(limit=page_size, offset=len(all_items)))
+            choice = await _prompt_async("Select a session (number, 'n', or 'm')" if has_more
+                                         else "Select a session (number or 'n')", default="1")
 
         cmd = choice.strip().lower()
+        if prefetch is not None and cmd != "m":
+            prefetch.cancel()
 
         if cmd == "n":
             with console.status("Creating session…"):
-                s = await client.sessions.create()
-            console.print(f"[green]✓ Session created:[/green]  [bold]{s['id']}[/bold]")
-            return s["id"]
+                sid = await _create_and_connect(client)
+            console.print(f"[green]✓ Session created:[/green]  [bold]{sid}[/bold]")
+            return sid
 
-        if cmd == "m" and len(all_items) < total:
-            offset = len(all_items)
+        if cmd == "m" and prefetch is not None:
             continue
 
         try:
@@ -238,40 +292,140 @@ async def _pick_or_create_session(client) -> Optional[str]:
             return None
 
 
-def _print_labeled(label: str, content: str, pad: int = 2, ts: str = ""):
+class _LineReader:
+    """Reads stdin lines through the event loop's fd watcher, without threads.
+
+    Waiting for input is an ordinary awaitable, so it can be cancelled (e.g.
+    on Ctrl+C) and never keeps a blocked thread around at exit.
+    """
+
+    def __init__(self, fd: int):
+        self._fd = fd
+        self._buf = b""
+        self._eof = False
+
+    async def readline(self, prompt: str = "") -> str:
+        console.file.write(prompt)
+        console.file.flush()
+        while b"\n" not in self._buf and not self._eof:
+            await self._wait_readable()
+            chunk = os.read(self._fd, 4096)
+            if chunk:
+                self._buf += chunk
+            else:
+                self._eof = True
+        if not self._buf:
+            raise EOFError
+        line, _, self._buf = self._buf.partition(b"\n")
+        return line.decode(sys.stdin.encoding or "utf-8", errors="replace").rstrip("\r")
+
+    async def _wait_readable(self):
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        try:
+            loop.add_reader(self._fd, lambda: ready.done() or ready.set_result(None))
+        except PermissionError:  # regular files can't be watched, but never block
+            return
+        try:
+            await ready
+        finally:
+            loop.remove_reader(self._fd)
+
+
+_stdin_reader: Optional[_LineReader] = None
+
+
+def _get_stdin_reader() -> _LineReader:
+    """Return the process-wide stdin reader, so buffered input is never lost."""
+    global _stdin_reader
+    if _stdin_reader is None:
+        _stdin_reader = _LineReader(sys.stdin.fileno())
+    return _stdin_reader
+
+
+async def _read_stdin_messages():
+    """Yield non-blank stdin lines until EOF."""
+    reader = _get_stdin_reader()
+    while True:
+        try:
+            line = await reader.readline()
+        except EOFError:
+            return
+        if line.strip():
+            yield line
+
+
+async def _prompt_async(text: str, default: str) -> str:
+    """Like click.prompt(text, default=default), without blocking the event loop."""
+    line = await _get_stdin_reader().readline(f"{text} [{default}]: ")
+    return line.strip() or default
+
+
+_YOU_LABEL = Text("You:", style="cyan")
+_PINE_LABEL = Text("Pine AI:", style="green")
+_FORM_LABEL = Text("Pine AI (form):", style="yellow")
+_THINKING_LINE = Text("  ● thinking…", style="dim")
+
+
+def _labeled(label: Text, content: str, pad: int = 2, ts: str = ""):
+    """Build a labeled message with all lines indented consistently."""
+    from rich.padding import Padding
+
+    ts_part = Text(f" ({format_timestamp(ts)})", style="dim") if ts else ""
+    return Padding(Text.assemble(label, ts_part, " ", content), (0, 0, 0, pad))
+
+
+def _print_labeled(label: Text, content: str, pad: int = 2, ts: str = ""):
     """Print a labeled message with all lines indented consistently."""
-    ts_part = f" [dim]({format_timestamp(ts)})[/dim]" if ts else ""
-    console.print(Padding(f"{label}{ts_part} {content}", (0, 0, 0, pad)), soft_wrap=False)
+    console.print(_labeled(label, content, pad=pad, ts=ts), soft_wrap=False)
+
+
+def _render_user_message(role: str, data: dict, ts: str) -> list:
+    content = data.get("content", "")
+    if role != "user" or not content:
+        return []
+    return [_labeled(_YOU_LABEL, content, ts=ts)]
+
+
+def _render_text(role: str, data: dict, ts: str) -> list:
+    content = data.get("content", "")
+    return [_labeled(_PINE_LABEL, content, ts=ts)] if content else []
+
+
+def _render_work_log(role: str, data: dict, ts: str) -> list:
+    rows = []
+    for step in data.get("steps", []):
+        details = step.get("step_details", "")
+        if details:
+            rows.append(_labeled(_PINE_LABEL, details, ts=ts))
+    return rows
+
+
+def _render_form(role: str, data: dict, ts: str) -> list:
+    user_msg = data.get("message_to_user", "")
+    return [_labeled(_FORM_LABEL, user_msg, ts=ts)] if user_msg else []
+
 
+_HISTORY_RENDERERS = {
+    "session:message": _render_user_message,
+    "session:text": _render_text,
+    "session:work_log": _render_work_log,
+    "session:form_to_user": _render_form,
+}
 
-def _print_history_message(msg):
+
+def _render_history_message(msg) -> list:
     """Render a single history message (compact format for chat context)."""
+    renderer = _HISTORY_RENDERERS.get(msg.get("type", ""))
+    if renderer is None:
+        return []
     meta = msg.get("metadata", {})
     source = meta.get("source", {})
     role = source.get("role", "unknown")
     ts = meta.get("timestamp", "")
-    msg_type = msg.get("type", "")
     payload = msg.get("payload", {})
     data = payload.get("data", {}) if isinstance(payload.get("data"), dict) else {}
-
-    if msg_type == "session:message" and role == "user":
-        content = data.get("content", "")
-        if content:
-            _print_labeled("[cyan]You:[/cyan]", content, ts=ts)
-    elif msg_type == "session:text":
-        content = data.get("content", "")
-        if content:
-            _print_labeled("[green]Pine AI:[/green]", content, ts=ts)
-    elif msg_type == "session:work_log":
-        steps = data.get("steps", [])
-        for step in steps:
-            details = step.get("step_details", "")
-            if details:
-                _print_labeled("[green]Pine AI:[/green]", details, ts=ts)
-    elif msg_type == "session:form_to_user":
-        user_msg = data.get("message_to_user", "")
-        if user_msg:
-            _print_labeled("[yellow]Pine AI (form):[/yellow]", user_msg, ts=ts)
+    return renderer(role, data, ts)
 
 
 class _StreamPrinter:
@@ -282,24 +436,23 @@ class _StreamPrinter:
         self._seen_steps: set[tuple[str, str]] = set()
 
     def feed(self, event):
+        data = event.data if isinstance(event.data, dict) else {}
         if event.type == S2CEvent.SESSION_TEXT_PART:
-            data = event.data if isinstance(event.data, dict) else {}
             content = data.get("content", "")
             if content:
                 if not self._in_text:
-                    console.print("[green]Pine AI:[/green] ", end="")
+                    console.print(_PINE_LABEL, end=" ")
                     self._in_text = True
                 console.file.write(content)
                 console.file.flush()
         elif event.type in (S2CEvent.SESSION_WORK_LOG, S2CEvent.SESSION_WORK_LOG_PART):
             self.flush()
-            self._print_work_steps(event)
+            self._print_work_steps(event, data)
         else:
             self.flush()
-            _print_event(event)
+            _print_event(event, data)
 
-    def _print_work_steps(self, event):
-        data = event.data if isinstance(event.data, dict) else {}
+    def _print_work_steps(self, event, data: dict):
         if event.type == S2CEvent.SESSION_WORK_LOG:
             steps = data.get("steps", [])
         else:
@@ -315,10 +468,8 @@ class _StreamPrinter:
             if key in self._seen_steps:
                 continue
             self._seen_steps.add(key)
-            if status:
-                console.print(f"[dim]  ● {title} \\[{status}][/dim]")
-            else:
-                console.print(f"[dim]  ● {title}[/dim]")
+            line = f"  ● {title} [{status}]" if status else f"  ● {title}"
+            console.print(Text(line, style="dim"))
 
     def flush(self):
         if self._in_text:
@@ -327,22 +478,40 @@ class _StreamPrinter:
             self._in_text = False
 
 
-def _print_event(event):
-    """Render a non-streaming chat event to the console."""
-    if event.type == S2CEvent.SESSION_TEXT:
-        data = event.data if isinstance(event.data, dict) else {}
-        content = data.get("content", "")
-        if content:
-            _print_labeled("[green]Pine AI:[/green]", content, pad=0)
-    elif event.type == S2CEvent.SESSION_FORM_TO_USER:
-        data = event.data if isinstance(event.data, dict) else {}
-        msg = data.get("message_to_user", "")
-        console.print(Panel(f"[yellow]{msg}[/yellow]\n{json.dumps(data, indent=2)}",
-                            title="Form Required", border_style="yellow"))
-    elif event.type == S2CEvent.SESSION_STATE:
-        data = event.data if isinstance(event.data, dict) else {}
-        state = data.get("content", "")
-        if state:
-            console.print(f"[dim]  ● state → {state}[/dim]")
-    elif event.type == S2CEvent.SESSION_THINKING:
-        console.print("[dim]  ● thinking…[/dim]")
+def _print_text(data: dict):
+    content = data.get("content", "")
+    if content:
+        _print_labeled(_PINE_LABEL, content, pad=0)
+
+
+def _print_form(data: dict):
+    from rich.panel import Panel
+
+    msg = data.get("message_to_user", "")
+    console.print(Panel(Text.assemble((msg, "yellow"), "\n", dumps(data, indent=True)),
+                        title="Form Required", border_style="yellow"))
+
+
+def _print_state(data: dict):
+    state = data.get("content", "")
+    if state:
+        console.print(Text(f"  ● state → {state}", style="dim"))
+
+
+def _print_thinking(data: dict):
+    console.print(_THINKING_LINE)
+
+
+_EVENT_PRINTERS = {
+    S2CEvent.SESSION_TEXT: _print_text,
+    S2CEvent.SESSION_FORM_TO_USER: _print_form,
+    S2CEvent.SESSION_STATE: _print_state,
+    S2CEvent.SESSION_THINKING: _print_thinking,
+}
+
+
+def _print_event(event, data: dict):
+    """Render a non-streaming chat event (with its dict payload) to the console."""
+    printer = _EVENT_PRINTERS.get(event.type)
+    if printer:
+        printer(data)
@@ -0,0 +1,132 @@
+"""pine completion show|install — static shell completion scripts."""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from pine_cli.config import CONFIG_DIR, console
+
+SHELLS = ("bash", "zsh", "fish")
+
+
+@click.group()
+def completion():
+    """Shell completion commands."""
+
+
+def _command_tree() -> dict[tuple[str, ...], tuple[list[str], list[str]]]:
+    """Map each command path to its (subcommand names, option flags)."""
+    from pine_cli.main import main
+
+    tree = {}
+
+    def _walk(cmd, ctx, path):
+        opts = ["--help"]
+        for param in cmd.params:
+            if isinstance(param, click.Option):
+                opts.extend(param.opts + param.secondary_opts)
+        subs = []
+        if isinstance(cmd, click.Group):
+            subs = cmd.list_commands(ctx)
+            for name in subs:
+                sub = cmd.get_command(ctx, name)
+                _walk(sub, click.Context(sub, parent=ctx, info_name=name), path + (name,))
+        tree[path] = (subs, opts)
+
+    _walk(main, click.Context(main, info_name="pine"), ())
+    return tree
+
+
+def _bash_script(tree) -> str:
+    paths = " | ".join(f'"{" ".join(p)}"' for p in tree if p)
+    cases = "\n".join(
+        f'        "{" ".join(path)}") words="{" ".join(subs + opts)}" ;;'
+        for path, (subs, opts) in tree.items()
+    )
+    return f"""# pine shell completion (bash) — generated by `pine completion show bash`
+_pine_completion() {{
+    local cur="${{COMP_WORDS[COMP_CWORD]}}" path="" candidate word words i
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        word="${{COMP_WORDS[i]}}"
+        candidate="${{path:+$path }}$word"
+        case "$candidate" in
+            {paths}) path="$candidate" ;;
+        esac
+    done
+    case "$path" in
+{cases}
+        *) words="" ;;
+    esac
+    COMPREPLY=($(compgen -W "$words" -- "$cur"))
+}}
+complete -o default -F _pine_completion pine
+"""
+
+
+def _zsh_script(tree) -> str:
+    return ("# pine shell completion (zsh) — generated by `pine completion show zsh`\n"
+            "autoload -U +X bashcompinit && bashcompinit\n"
+            + _bash_script(tree).split("\n", 1)[1])
+
+
+def _fish_script(tree) -> str:
+    lines = ["# pine shell completion (fish) — generated by `pine completion show fish`",
+             "complete -c pine -f"]
+    for path, (subs, opts) in tree.items():
+        if path:
+            cond = "; and ".join(f"__fish_seen_subcommand_from {name}" for name in path)
+        else:
+            cond = "__fish_use_subcommand"
+        if subs:
+            # Stop offering subcommands once one of them has been typed.
+            lines.append(f'complete -c pine -n "{cond}; and not __fish_seen_subcommand_from {" ".join(subs)}" '
+                         f'-a "{" ".join(subs)}"')
+        for opt in opts:
+            flag = f"-l {opt[2:]}" if opt.startswith("--") else f"-s {opt[1:]}"
+            lines.append(f'complete -c pine -n "{cond}" {flag}')
+    return "\n".join(lines) + "\n"
+
+
+_GENERATORS = {"bash": _bash_script, "zsh": _zsh_script, "fish": _fish_script}
+
+
+def _install_path(shell: str) -> Path:
+    if shell == "bash":
+        data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+        base = os.environ.get("BASH_COMPLETION_USER_DIR") or Path(data_home) / "bash-completion"
+        return Path(base) / "completions" / "pine"
+    if shell == "fish":
+        config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+        return Path(config_home) / "fish" / "completions" / "pine.fish"
+    return CONFIG_DIR / "completion.zsh"
+
+
+def _resolve_shell(shell: Optional[str]) -> str:
+    shell = shell or os.path.basename(os.environ.get("SHELL", ""))
+    if shell not in SHELLS:
+        raise click.UsageError(f"Could not detect your shell; pass one of: {', '.join(SHELLS)}")
+    return shell
+
+
+@completion.command("show")
+@click.argument("shell", required=False, type=click.Choice(SHELLS))
+def completion_show(shell: Optional[str]):
+    """Print the completion script for SHELL (default: $SHELL)."""
+    click.echo(_GENERATORS[_resolve_shell(shell)](_command_tree()), nl=False)
+
+
+@completion.command("install")
+@click.argument("shell", required=False, type=click.Choice(SHELLS))
+def completion_install(shell: Optional[str]):
+    """Write the completion script for SHELL (default: $SHELL) where the shell loads it."""
+    shell = _resolve_shell(shell)
+    path = _install_path(shell)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(_GENERATORS[shell](_command_tree()))
+    console.print(f"[green]✓ Installed {shell} completion:[/green] {path}")
+    if shell == "zsh":
+        console.print(f"[dim]Add to ~/.zshrc:  source {path}[/dim]")
+    else:
+        console.print("[dim]Open a new shell to use it.[/dim]")
@@ -1,86 +1,374 @@
 """Shared configuration and client helpers."""
 
 import asyncio
+import atexit
+import dataclasses
+import functools
 import json
-from datetime import datetime, timezone
+import os
+import sys
+from collections.abc import Mapping
+from contextlib import nullcontext, suppress
+from datetime import date, datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from rich.console import Console
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install "pineai-cli[fast]"
+    orjson = None
 
 CONFIG_DIR = Path.home() / ".pine"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
-console = Console()
 
 
-def load_config() -> dict[str, Any]:
+class _LazyConsole:
+    """Stand-in for a rich Console that imports rich and builds it on first use.
+
+    Keeps rich off the import path of commands that only print JSON.
+    """
+
+    def __init__(self):
+        self._console = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            self._console = _make_console()
+        return getattr(self._console, name)
+
+
+def _make_console():
+    """Build the Console with terminal detection settled once, up front.
+
+    Left to itself rich re-probes the environment and isatty() on every print;
+    pinning force_terminal avoids that, and piped output gets no styling at all.
+    FORCE_COLOR / TTY_COMPATIBLE still override, via rich's own detection.
+    """
+    from rich.console import Console
+
+    if os.environ.get("FORCE_COLOR") is not None or os.environ.get("TTY_COMPATIBLE"):
+        return Console()
+    if sys.stdout.isatty():
+        return Console(force_terminal=True)
+    return Console(force_terminal=False, no_color=True, highlight=False)
+
+
+console = _LazyConsole()
+
+
+def _json_default(obj: Any) -> Any:
+    # SDK result types are dataclasses; orjson encodes those natively, json needs this.
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default)
+
+
+def emit_json(obj: Any, indent: bool = False) -> None:
+    """Write obj to stdout as JSON plus a newline, bypassing the text layer."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+        data = orjson.dumps(obj, option=option)
+    else:
+        data = (json.dumps(obj, indent=2 if indent else None, default=_json_default) + "\n").encode()
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(data.decode())
+        sys.stdout.flush()
+        return
+    out.write(data)
+    # Flush every document: scripts read `pine send --json` events as they arrive.
+    out.flush()
+
+
+def maybe_status(message: str, quiet: bool = False):
+    """A console spinner, or a no-op context when quiet (e.g. JSON output)."""
+    return nullcontext() if quiet else console.status(message)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached() -> Mapping[str, Any]:
     try:
-        return json.loads(CONFIG_FILE.read_text())
+        return MappingProxyType(loads(CONFIG_FILE.read_bytes()))
     except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+        return MappingProxyType({})
+
+
+def load_config() -> Mapping[str, Any]:
+    """Return the saved config, read from disk at most once per process.
+
+    The result is read-only; build a new dict (e.g. ``{**cfg, ...}``) to modify it.
+    """
+    return _load_config_cached()
+
+
+def reload_config() -> None:
+    """Forget the cached config so the next load_config() re-reads the file.
+
+    For long-lived processes (pine daemon) that must see logins done elsewhere.
+    """
+    _load_config_cached.cache_clear()
 
 
 def save_config(cfg: dict[str, Any]) -> None:
+    """Write the config atomically; a no-op if the file already has this content."""
+    data = (dumps(cfg, indent=True) + "\n").encode()
+    try:
+        if CONFIG_FILE.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    import tempfile
+
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(cfg, indent=2) + "\n")
+    # mkstemp gives a unique path (concurrent logins don't clobber each other's
+    # temp file) created with mode 0600, so the token is never left readable by others.
+    fd, tmp = tempfile.mkstemp(dir=CONFIG_DIR, prefix=".config.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, CONFIG_FILE)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp)
+        raise
+    reload_config()
+
 
+def update_config(**patch: Any) -> None:
+    """Merge non-None values into the saved config with a single write."""
+    save_config({**load_config(), **{k: v for k, v in patch.items() if v is not None}})
 
-def require_auth() -> dict[str, Any]:
+
+def require_auth() -> Mapping[str, Any]:
     """Return config or exit if not logged in."""
     cfg = load_config()
-    if not cfg.get("access_token") or not cfg.get("user_id"):
+    token = cfg.get("access_token")
+    user_id = cfg.get("user_id")
+    if not token or not user_id:
         console.print("[red]Not logged in. Run [bold]pine auth login[/bold] first.[/red]")
         raise SystemExit(1)
     return cfg
 
 
-def get_voice_client():
-    """Build an authenticated PineVoice (sync) client."""
-    from pine_voice import PineVoice
+# SDK clients built in this process, keyed by their constructor arguments. Reusing
+# them shares each SDK's HTTP connection pool; _close_clients() releases them at exit.
+_voice_clients: dict[tuple, Any] = {}
+_assistant_clients: dict[tuple, Any] = {}
+
+
+def _make_voice_client(access_token: str, user_id: str):
+    key = (access_token, user_id)
+    if key not in _voice_clients:
+        from pine_voice import AsyncPineVoice
+
+        _voice_clients[key] = AsyncPineVoice(access_token=access_token, user_id=user_id)
+    return _voice_clients[key]
+
 
+def make_assistant_client(base_url: str, access_token: str | None = None, user_id: str | None = None):
+    """Return an AsyncPineAI client, reused for identical arguments within a process."""
+    key = (base_url, access_token, user_id)
+    if key not in _assistant_clients:
+        from pine_assistant.client import AsyncPineAI
+
+        _assistant_clients[key] = AsyncPineAI(access_token=access_token, user_id=user_id, base_url=base_url)
+    return _assistant_clients[key]
+
+
+def get_voice_client():
+    """Build an authenticated AsyncPineVoice client."""
     cfg = require_auth()
-    return PineVoice(access_token=cfg["access_token"], user_id=cfg["user_id"])
+    return _make_voice_client(cfg["access_token"], cfg["user_id"])
 
 
 def get_assistant_client():
     """Build an authenticated AsyncPineAI client."""
-    from pine_assistant.client import AsyncPineAI
-
     cfg = require_auth()
-    return AsyncPineAI(
+    return make_assistant_client(
+        cfg.get("base_url", "https://www.19pine.ai"),
         access_token=cfg["access_token"],
         user_id=cfg["user_id"],
-        base_url=cfg.get("base_url", "https://www.19pine.ai"),
     )
 
 
+async def connect_alongside(client, coro):
+    """Await ``coro`` while the client's socket connects, and return its result.
+
+    Both are awaited to completion; if either fails, the client is disconnected
+    before re-raising, so a failed HTTP call doesn't leave a socket open behind it.
+    The same goes if the caller is cancelled while waiting.
+    """
+    try:
+        result, connected = await asyncio.gather(coro, client.connect(), return_exceptions=True)
+    except asyncio.CancelledError:
+        with suppress(Exception):
+            await client.disconnect()
+        raise
+    for outcome in (result, connected):
+        if isinstance(outcome, BaseException):
+            with suppress(Exception):
+                await client.disconnect()
+            raise outcome
+    return result
+
+
+def _leave_drain_timeout() -> float:
+    """Upper bound in seconds for leave_and_flush, from PINE_LEAVE_DRAIN_MS (default 1000)."""
+    try:
+        return max(int(os.environ.get("PINE_LEAVE_DRAIN_MS", "1000")), 0) / 1000
+    except ValueError:
+        return 1.0
+
+
+def _engineio_send_queue(client):
+    """Return the Engine.IO outbound queue behind an AsyncPineAI client, or None.
+
+    This walks private attributes of three packages, last checked against
+    pine-assistant 0.3.3, python-socketio 5.17 and python-engineio 4.14:
+    AsyncPineAI._sio (SocketIOManager) -> ._sio (socketio.AsyncClient) -> .eio
+    (engineio.AsyncClient) -> .queue, an asyncio.Queue whose write loop calls
+    task_done() once each packet is sent. Re-check the chain when upgrading them.
+    """
+    sio = getattr(getattr(client, "_sio", None), "_sio", None)
+    queue = getattr(getattr(sio, "eio", None), "queue", None)
+    if queue is None or not hasattr(queue, "join"):
+        import warnings
+
+        warnings.warn("pine: Socket.IO send queue not found; leave_and_flush will wait its full timeout",
+                      RuntimeWarning, stacklevel=3)
+        return None
+    return queue
+
+
+async def leave_and_flush(client, session_id: str, timeout: float | None = None) -> None:
+    """Leave a session and wait until queued outbound messages are on the wire.
+
+    The SDK's leave_session() and send_message() only schedule their emits, and
+    disconnecting right away can drop them. Instead of a fixed sleep, wait for
+    the scheduled emit and for Socket.IO's send queue to drain, up to ``timeout``
+    (default: PINE_LEAVE_DRAIN_MS).
+    """
+    if timeout is None:
+        timeout = _leave_drain_timeout()
+    queue = _engineio_send_queue(client)
+    # leave_session() schedules its emit as a task without returning it, so find
+    # it (and any emits it spawns) by diffing the loop's task set around the call.
+    before = asyncio.all_tasks()
+    client.leave_session(session_id)
+    if queue is None:
+        await asyncio.sleep(timeout)
+        return
+    scheduled = asyncio.all_tasks() - before
+
+    async def _drain():
+        if scheduled:
+            await asyncio.wait(scheduled)
+        await queue.join()
+
+    with suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(_drain(), timeout)
+
+
 def format_timestamp(raw: str) -> str:
     """Turn an ISO timestamp into a short local-time string."""
     if not raw:
         return ""
+    return _format_timestamp(raw, datetime.now(timezone.utc).astimezone().date())
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp(raw: str, today: date) -> str:
+    # Keyed on today's date as well, so cached results don't go stale at midnight.
     try:
         dt = datetime.fromisoformat(raw.replace("Z", "+00:00")).astimezone()
-        now = datetime.now(timezone.utc).astimezone()
-        if dt.date() == now.date():
+        if dt.date() == today:
             return dt.strftime("%H:%M")
-        if dt.year == now.year:
+        if dt.year == today.year:
             return dt.strftime("%b %d %H:%M")
         return dt.strftime("%Y-%m-%d %H:%M")
     except (ValueError, OSError):
         return raw
 
 
+_loop: asyncio.AbstractEventLoop | None = None
+
+
 def run_async(coro):
-    """Run an async coroutine from sync context."""
-    import logging
-    for name in ("asyncio", "engineio", "socketio"):
-        logging.getLogger(name).setLevel(logging.CRITICAL)
-    loop = asyncio.new_event_loop()
+    """Run an async coroutine from sync context.
+
+    All calls in a process share one event loop, created on first use and
+    closed at interpreter exit. When the caller's thread is already running a
+    loop (e.g. IPython), the shared loop is driven from a worker thread instead.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        import logging
+        for name in ("asyncio", "engineio", "socketio"):
+            logging.getLogger(name).setLevel(logging.CRITICAL)
+        _loop = asyncio.new_event_loop()
     try:
-        return loop.run_until_complete(coro)
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_tracked(coro)
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_run_tracked, coro).result()
+
+
+_running: asyncio.Task | None = None
+
+
+def _run_tracked(coro):
+    global _running
+    _running = task = _loop.create_task(coro)
+    try:
+        return _loop.run_until_complete(task)
     finally:
-        loop.close()
+        _running = None
+
+
+def cancel_async() -> None:
+    """Cancel the coroutine run_async is currently running; safe from any thread.
+
+    The command sees a CancelledError at its next await, as if interrupted.
+    """
+    task, loop = _running, _loop
+    if task is not None and loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(task.cancel)
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Close cached SDK clients' connection pools, then the shared event loop."""
+    if _loop is None or _loop.is_closed():
+        return
+    closers = [client.close() for client in _voice_clients.values()]
+    closers += [client.http.close() for client in _assistant_clients.values()]
+    _voice_clients.clear()
+    _assistant_clients.clear()
+    if closers:
+        async def _close_all():
+            await asyncio.gather(*closers, return_exceptions=True)
+
+        _loop.run_until_complete(_close_all())
+    _loop.close()
 
 
 def handle_api_errors(fn):
@@ -0,0 +1,379 @@
+"""pine daemon start|stop|status — keep one warm pine process for scripted use.
+
+The daemon listens on a Unix socket and runs forwarded commands in-process, one
+at a time, on its shared event loop and cached SDK clients. While it is running,
+``pine sessions|task|voice|send ...`` hand their arguments to it and relay its
+output, so a script of many commands pays for Python startup, imports and
+connection setup once. Set PINE_NO_DAEMON=1 to always run in-process.
+The client's PINE_* environment variables (e.g. PINE_LEAVE_DRAIN_MS) are sent
+along and apply to that one command.
+
+Each connection is served on its own thread. A command is cancelled when its
+client goes away (e.g. Ctrl+C), and the client runs the command in-process
+itself if the daemon is busy with another one, doesn't answer in time, or runs
+a different pine version.
+
+This module is imported on the client path, so it sticks to light stdlib
+imports at module level.
+
+Wire format: the client sends one JSON line ``{"op": "run"|"ping"|"stop", ...}``;
+the daemon answers with frames of a 1-byte stream id, a 4-byte big-endian
+length and the payload. A 3 (ready) frame carries the daemon's pid and version
+as JSON and means it has taken the request; 4 (declined) means the client should
+run the command itself. Then come 1 (stdout) and 2 (stderr) frames, and a
+0 (exit) frame with the exit code as ASCII ends the exchange.
+"""
+
+import io
+import json
+import os
+import socket
+import struct
+import sys
+from contextlib import suppress
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from pine_cli import __version__
+
+# Commands that are safe to run remotely: no prompts, no stdin, no local files.
+DAEMON_COMMANDS = frozenset({"sessions", "task", "voice", "send"})
+
+_EXIT, _STDOUT, _STDERR, _READY, _DECLINED = 0, 1, 2, 3, 4
+_HEADER = struct.Struct(">BI")
+
+# Seconds a client waits for the daemon to take its request before running it
+# in-process, and that a command waits for the one ahead of it to finish.
+_HANDSHAKE_TIMEOUT = 3.0
+_BUSY_WAIT = 1.0
+
+
+def socket_path() -> Path:
+    """Where the daemon listens: $XDG_RUNTIME_DIR/pine.sock, else ~/.pine/pine.sock."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    return Path(runtime_dir) / "pine.sock" if runtime_dir else Path.home() / ".pine" / "pine.sock"
+
+
+def should_forward(args: list[str]) -> bool:
+    """True if this command line can go to a daemon that appears to be running."""
+    return (bool(args) and args[0] in DAEMON_COMMANDS and "--batch" not in args
+            and not os.environ.get("PINE_NO_DAEMON") and socket_path().exists())
+
+
+def _connect() -> Optional[socket.socket]:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(_HANDSHAKE_TIMEOUT)
+    try:
+        sock.connect(str(socket_path()))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _request(sock: socket.socket, op: str, info: Optional[dict] = None, **fields) -> Optional[int]:
+    """Send one request and relay the reply frames to stdout/stderr; return the exit code.
+
+    Returns None if the daemon declines the request or doesn't take it in time.
+    The ready frame's pid and version are stored in ``info`` if given.
+    """
+    sock.sendall(json.dumps({"op": op, **fields}).encode() + b"\n")
+    reader = sock.makefile("rb")
+    outputs = {_STDOUT: sys.stdout.buffer, _STDERR: sys.stderr.buffer}
+    ready = False
+    while True:
+        try:
+            header = reader.read(_HEADER.size)
+        except TimeoutError:  # only set until the ready frame: a busy or stuck daemon
+            return None
+        if len(header) < _HEADER.size:
+            if not ready:
+                return None
+            click.echo("pine daemon: connection closed before the command finished.", err=True)
+            return 1
+        stream, length = _HEADER.unpack(header)
+        payload = reader.read(length)
+        if stream == _EXIT:
+            return int(payload or b"1")
+        if stream == _DECLINED:
+            return None
+        if stream == _READY:
+            ready = True
+            sock.settimeout(None)  # the command itself may take as long as it needs
+            if info is not None:
+                info.update(json.loads(payload))
+            continue
+        outputs[stream].write(payload)
+        outputs[stream].flush()
+
+
+def _ping() -> Optional[dict]:
+    """The running daemon's pid and version, or None if no daemon answers."""
+    sock = _connect()
+    if sock is None:
+        return None
+    info = {}
+    with sock:
+        if _request(sock, "ping", info=info) is None:
+            return None
+    return info
+
+
+def forward(args: list[str]) -> Optional[int]:
+    """Run a command line in the daemon; None if no daemon is reachable."""
+    sock = _connect()
+    if sock is None:
+        return None
+    env = {k: v for k, v in os.environ.items() if k.startswith("PINE_") and k != "PINE_NO_DAEMON"}
+    with sock:
+        try:
+            return _request(sock, "run", argv=args, env=env, version=__version__)
+        except KeyboardInterrupt:
+            return 130
+
+
+class _FrameWriter(io.RawIOBase):
+    """Binary stream that sends each write to the client as one frame."""
+
+    def __init__(self, sock: socket.socket, stream: int):
+        self._sock, self._stream = sock, stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        if data:
+            _send_frame(self._sock, self._stream, data)
+        return len(data)
+
+
+def _send_frame(sock: socket.socket, stream: int, payload: bytes) -> None:
+    sock.sendall(_HEADER.pack(stream, len(payload)) + payload)
+
+
+def _send_exit(sock: socket.socket, code: int) -> None:
+    _send_frame(sock, _EXIT, str(code).encode())
+
+
+def _send_ready(sock: socket.socket) -> None:
+    _send_frame(sock, _READY, json.dumps({"pid": os.getpid(), "version": __version__}).encode())
+
+
+def _read_request(sock: socket.socket) -> Optional[dict]:
+    """Parse the client's request line; None if it is not a well-formed request."""
+    try:
+        request = json.loads(sock.makefile("rb").readline() or b"{}")
+    except ValueError:
+        return None
+    if not isinstance(request, dict):
+        return None
+    argv, env = request.get("argv", []), request.get("env", {})
+    if not (isinstance(argv, list) and all(isinstance(a, str) for a in argv)):
+        return None
+    if not (isinstance(env, dict) and all(isinstance(k, str) and k.startswith("PINE_") and isinstance(v, str)
+                                          for k, v in env.items())):
+        return None
+    return request
+
+
+def _handle(sock: socket.socket, lock) -> bool:
+    """Serve one client connection; return False when asked to stop."""
+    request = _read_request(sock)
+    if request is None:
+        _send_exit(sock, 2)
+        return True
+    op = request.get("op")
+    if op == "ping":
+        _send_ready(sock)
+        _send_exit(sock, 0)
+        return True
+    if op == "stop":
+        _send_ready(sock)
+        _send_exit(sock, 0)
+        return False
+    if op != "run":
+        _send_exit(sock, 2)
+        return True
+    if request.get("version") != __version__:
+        _send_frame(sock, _DECLINED, f"daemon runs pine {__version__}".encode())
+        return True
+    # Commands share the event loop, sys.stdout and os.environ, so run one at a time.
+    if not lock.acquire(timeout=_BUSY_WAIT):
+        _send_frame(sock, _DECLINED, b"busy")
+        return True
+    try:
+        _send_ready(sock)
+        _run(sock, request)
+    finally:
+        lock.release()
+    return True
+
+
+def _run(sock: socket.socket, request: dict) -> None:
+    """Run a forwarded command with the client's env and output streams."""
+    import asyncio
+    import threading
+
+    from pine_cli.batch import run_one
+    from pine_cli.config import cancel_async, reload_config
+
+    finished, guard = threading.Event(), threading.Lock()
+
+    def _watch():
+        # The client sends nothing after its request, so EOF here means it went
+        # away (e.g. Ctrl+C): cancel its command instead of running it to the end.
+        with suppress(OSError):
+            sock.recv(1)
+        with guard:
+            if not finished.is_set():
+                cancel_async()
+
+    threading.Thread(target=_watch, daemon=True).start()
+    # Pick up logins and logouts done by other pine processes since the last command.
+    reload_config()
+    env = request.get("env", {})
+    saved_env = {k: v for k, v in os.environ.items() if k.startswith("PINE_") and k != "PINE_NO_DAEMON"}
+    for k in saved_env:
+        del os.environ[k]
+    os.environ.update({k: v for k, v in env.items() if k != "PINE_NO_DAEMON"})
+    out = io.TextIOWrapper(io.BufferedWriter(_FrameWriter(sock, _STDOUT)), write_through=True)
+    err = io.TextIOWrapper(io.BufferedWriter(_FrameWriter(sock, _STDERR)), write_through=True)
+    saved = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = out, err
+    try:
+        code = run_one(list(request.get("argv", [])))
+    except asyncio.CancelledError:
+        code = 130
+    except Exception as exc:  # keep serving after a command blows up
+        err.write(f"pine daemon: {exc!r}\n")
+        code = 1
+    finally:
+        with guard:
+            finished.set()
+        for stream in (out, err):
+            with suppress(OSError):
+                stream.flush()
+        sys.stdout, sys.stderr = saved
+        for k in env:
+            os.environ.pop(k, None)
+        os.environ.update(saved_env)
+    _send_exit(sock, code)
+
+
+def _serve_connection(conn: socket.socket, lock, stopping) -> None:
+    try:
+        with suppress(OSError):  # OSError: client went away mid-command
+            if not _handle(conn, lock):
+                stopping.set()
+    finally:
+        with suppress(OSError):
+            conn.shutdown(socket.SHUT_RDWR)  # also wakes _run's disconnect watcher
+        conn.close()
+
+
+def serve() -> None:
+    """Listen on the daemon socket, serving each connection on its own thread until stopped."""
+    import threading
+
+    from pine_cli.config import cancel_async
+
+    os.environ["PINE_NO_DAEMON"] = "1"  # commands run here must not forward to ourselves
+    path = socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)  # the socket acts with the user's credentials
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    server.settimeout(0.5)  # wake up now and then to notice a stop request
+    lock, stopping = threading.Lock(), threading.Event()
+    try:
+        while not stopping.is_set():
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                continue
+            threading.Thread(target=_serve_connection, args=(conn, lock, stopping), daemon=True).start()
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+        # Let a command still running unwind before the event loop is closed at exit.
+        cancel_async()
+        if lock.acquire(timeout=5):
+            lock.release()
+
+
+@click.group()
+def daemon():
+    """Background daemon commands (for scripts running many commands)."""
+
+
+@daemon.command("start")
+def daemon_start():
+    """Start the daemon in the background."""
+    import subprocess
+    import time
+
+    from pine_cli.config import console
+
+    if (info := _ping()) is not None:
+        console.print("[yellow]Daemon already running.[/yellow]")
+        _warn_version(info)
+        return
+    proc = subprocess.Popen([sys.executable, "-m", "pine_cli.daemon"], start_new_session=True,
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and proc.poll() is None:
+        if (sock := _connect()) is not None:
+            sock.close()
+            console.print(f"[green]✓ Daemon started[/green]  (pid {proc.pid}, socket {socket_path()})")
+            return
+        time.sleep(0.05)
+    raise click.ClickException("Daemon did not come up; run `python -m pine_cli.daemon` to see why.")
+
+
+@daemon.command("stop")
+def daemon_stop():
+    """Stop the running daemon."""
+    from pine_cli.config import console
+
+    sock = _connect()
+    if sock is None:
+        console.print("[dim]Daemon is not running.[/dim]")
+        return
+    with sock:
+        if _request(sock, "stop") is None:
+            raise click.ClickException("Daemon did not respond.")
+    console.print("[green]✓ Daemon stopped.[/green]")
+
+
+@daemon.command("status")
+def daemon_status():
+    """Show whether the daemon is running."""
+    from pine_cli.config import console
+
+    info = _ping()
+    if info is None:
+        console.print("[dim]○ Daemon is not running.[/dim]")
+        return
+    console.print(f"[green]● Daemon running[/green]  (pid {info.get('pid', '?')}, "
+                  f"version {info.get('version', '?')}, socket {socket_path()})")
+    _warn_version(info)
+
+
+def _warn_version(info: dict) -> None:
+    from pine_cli.config import console
+
+    if info.get("version") != __version__:
+        console.print(f"[yellow]The daemon runs pine {info.get('version', '?')}, not {__version__}; commands run "
+                      "in-process until it is restarted (pine daemon stop && pine daemon start).[/yellow]")
+
+
+if __name__ == "__main__":
+    serve()
@@ -7,33 +7,62 @@ Commands:
   pine chat [session-id]          Interactive assistant chat (pick or create session)
   pine send -s <id> <message>     Send a message to an existing session
   pine send --new <message>       Create a session and send (non-interactive)
+  pine send -s <id> --batch       Send each stdin line over one connection
   pine sessions list|get|create|delete  Session management
   pine task start|stop            Task lifecycle
+  pine completion show|install    Shell completion scripts
+  pine daemon start|stop|status   Warm background process for scripts
 """
 
+import importlib
+import sys
+
 import click
 
 from pine_cli import __version__
 
 
-@click.group()
-@click.version_option(__version__, prog_name="pine")
-def main():
-    """Pine AI CLI — voice calls & assistant tasks from your terminal."""
+class LazyGroup(click.Group):
+    """Group that imports each subcommand's module only when it is invoked."""
+
+    lazy_subcommands = {
+        "auth": "pine_cli.auth:auth",
+        "voice": "pine_cli.voice:voice",
+        "chat": "pine_cli.chat:chat_cmd",
+        "send": "pine_cli.chat:send_cmd",
+        "sessions": "pine_cli.sessions:sessions",
+        "task": "pine_cli.tasks:task",
+        "completion": "pine_cli.completion:completion",
+        "daemon": "pine_cli.daemon:daemon",
+    }
+
+    def main(self, args=None, **kwargs):
+        # Hand the command to a running `pine daemon`, if there is one and this is a
+        # standalone run (pine_cli.batch calls in-process with standalone_mode=False).
+        args = sys.argv[1:] if args is None else list(args)
+        if kwargs.get("standalone_mode", True):
+            from pine_cli import daemon
 
+            if daemon.should_forward(args):
+                code = daemon.forward(args)
+                if code is not None:
+                    sys.exit(code)
+        return super().main(args, **kwargs)
 
-from pine_cli.auth import auth
-from pine_cli.voice import voice
-from pine_cli.chat import chat_cmd, send_cmd
-from pine_cli.sessions import sessions
-from pine_cli.tasks import task
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
 
-main.add_command(auth)
-main.add_command(voice)
-main.add_command(chat_cmd)
-main.add_command(send_cmd)
-main.add_command(sessions)
-main.add_command(task)
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module, attr = self.lazy_subcommands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup)
+@click.version_option(__version__, prog_name="pine")
+def main():
+    """Pine AI CLI — voice calls & assistant tasks from your terminal."""
 
 
 if __name__ == "__main__":
@@ -1,15 +1,16 @@
 """pine sessions list|get|create|delete — session management."""
 
 import asyncio
-import json
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from pine_cli.config import get_assistant_client, run_async, handle_api_errors, format_timestamp
+from pine_cli.config import connect_alongside, console, dumps, emit_json, get_assistant_client, leave_and_flush, maybe_status, run_async, handle_api_errors, format_timestamp
 
-console = Console()
+
+_STATE_COLORS = {
+    "chat": "green", "task_processing": "blue", "task_finished": "cyan",
+    "init": "yellow", "active": "green",
+}
 
 
 @click.group()
@@ -21,15 +22,33 @@ def sessions():
 @click.option("--state", default=None, help="Filter by state (e.g. init, active, task_finished)")
 @click.option("--limit", default=10, type=int, help="Max results (default: 10)")
 @click.option("--offset", default=0, type=int, help="Skip first N results (for pagination)")
+@click.option("--with-history", default=0, type=click.IntRange(min=0),
+              help="Also show the last N messages of each listed session")
 @click.option("--json-output", "--json", is_flag=True, help="Output as JSON")
 @handle_api_errors
-def sessions_list(state, limit, offset, json_output):
+def sessions_list(state, limit, offset, with_history, json_output):
     """List sessions."""
     async def _list():
+        from rich.table import Table
+
         client = get_assistant_client()
-        result = await client.sessions.list(state=state, limit=limit, offset=offset)
+        histories = {}
+        if with_history:
+            result = await connect_alongside(client, client.sessions.list(state=state, limit=limit, offset=offset))
+            try:
+                histories = await _fetch_histories(client, [s["id"] for s in result["sessions"]], with_history)
+            finally:
+                await client.disconnect()
+            for s in result["sessions"]:
+                history = histories.get(s["id"])
+                if isinstance(history, BaseException):
+                    s["history_error"] = str(history)
+                elif history is not None:
+                    s["messages"] = history
+        else:
+            result = await client.sessions.list(state=state, limit=limit, offset=offset)
         if json_output:
-            click.echo(json.dumps(result, indent=2))
+            emit_json(result, indent=True)
             return
         total = result['total']
         end = min(offset + limit, total)
@@ -37,16 +56,13 @@ def sessions_list(state, limit, offset, json_output):
         table = Table(title=title)
         table.add_column("ID", style="bold", no_wrap=True)
         table.add_column("State")
-        table.add_column("Title", max_width=50)
+        table.add_column("Title", max_width=50, no_wrap=True, overflow="ellipsis")
         table.add_column("Updated")
-        for s in result["sessions"]:
-            state_color = {
-                "chat": "green", "task_processing": "blue", "task_finished": "cyan",
-                "init": "yellow", "active": "green",
-            }.get(s.get("state", ""), "white")
-            table.add_row(s["id"], f"[{state_color}]{s.get('state', '')}[/{state_color}]",
-                          s.get("title", ""), format_timestamp(s.get("updated_at", "")))
+        for row in _session_rows(result["sessions"]):
+            table.add_row(*row)
         console.print(table)
+        if with_history:
+            _print_session_histories(result["sessions"], histories)
         if end < total:
             next_offset = offset + limit
             console.print(f"[dim]Showing {offset + 1}–{end} of {total}. Next page: pine sessions list --offset {next_offset}[/dim]")
@@ -54,6 +70,48 @@ def sessions_list(state, limit, offset, json_output):
     run_async(_list())
 
 
+def _session_rows(items):
+    """Yield (id, state, title, updated) cells for the sessions table."""
+    from rich.text import Text
+
+    for s in items:
+        state = s.get("state") or ""
+        yield (s["id"], Text(state, style=_STATE_COLORS.get(state, "white")),
+               Text(s.get("title") or ""), format_timestamp(s.get("updated_at") or ""))
+
+
+async def _fetch_histories(client, session_ids, limit: int) -> dict:
+    """Fetch recent history for several sessions concurrently over one connection.
+
+    Maps each session id to its message list, or to the exception that fetch raised.
+    """
+    async def _one(sid):
+        await client.join_session(sid)
+        history = await client.get_history(sid, max_messages=limit, order="asc")
+        await leave_and_flush(client, sid)
+        return history.get("messages", [])
+
+    results = await asyncio.gather(*(_one(sid) for sid in session_ids), return_exceptions=True)
+    return dict(zip(session_ids, results, strict=True))
+
+
+def _print_session_histories(items, histories: dict):
+    """Print the fetched history of each listed session under a short heading."""
+    from rich.markup import escape
+    from rich.text import Text
+
+    for s in items:
+        messages = histories.get(s["id"])
+        console.print(Text.assemble("\n", (s["id"], "bold"), "  ", s.get("title") or ""))
+        if isinstance(messages, BaseException):
+            console.print(f"  [red]History unavailable:[/red] {escape(str(messages))}", highlight=False)
+        elif not messages:
+            console.print("  [dim]No messages.[/dim]")
+        else:
+            console.print(_history_group(messages))
+    console.print()
+
+
 @sessions.command("get")
 @click.argument("session_id")
 @click.option("--limit", default=30, type=int, help="Max conversation messages (default: 30)")
@@ -64,76 +122,111 @@ def sessions_get(session_id, limit, json_output):
     async def _get():
         client = get_assistant_client()
 
-        metadata = await client.sessions.get(session_id)
-
-        await client.connect()
+        metadata = await connect_alongside(client, client.sessions.get(session_id))
         try:
+            if not json_output:
+                _print_session_header(metadata)
             await client.join_session(session_id)
             history = await client.get_history(session_id, max_messages=limit, order="asc")
-            client.leave_session(session_id)
-            await asyncio.sleep(1)
+            messages = history.get("messages", [])
+
+            if json_output:
+                metadata["messages"] = messages
+                emit_json(metadata, indent=True)
+            elif not messages:
+                console.print("\n[dim]No messages.[/dim]")
+            else:
+                console.print(f"\n[bold]Conversation ({len(messages)} messages):[/bold]")
+                console.print(_history_group(messages))
+                console.print()
+            await leave_and_flush(client, session_id)
         finally:
             await client.disconnect()
 
-        if json_output:
-            metadata["messages"] = history.get("messages", [])
-            click.echo(json.dumps(metadata, indent=2))
-            return
+    run_async(_get())
 
-        console.print(f"[bold]Session {metadata['id']}[/bold]")
-        console.print(f"  State: {metadata.get('state', '?')}")
-        console.print(f"  Title: {metadata.get('title', '—')}")
-        console.print(f"  Created: {format_timestamp(metadata.get('created_at', ''))}")
-        console.print(f"  Updated: {format_timestamp(metadata.get('updated_at', ''))}")
-        console.print(f"  URL: https://www.19pine.ai/app/chat/{metadata['id']}")
 
-        messages = history.get("messages", [])
-        if not messages:
-            console.print("\n[dim]No messages.[/dim]")
-            return
+def _print_session_header(metadata):
+    """Print a session's metadata block."""
+    console.print(f"[bold]Session {metadata['id']}[/bold]")
+    console.print(f"  State: {metadata.get('state', '?')}")
+    console.print(f"  Title: {metadata.get('title', '—')}")
+    console.print(f"  Created: {format_timestamp(metadata.get('created_at', ''))}")
+    console.print(f"  Updated: {format_timestamp(metadata.get('updated_at', ''))}")
+    console.print(f"  URL: https://www.19pine.ai/app/chat/{metadata['id']}")
 
-        console.print(f"\n[bold]Conversation ({len(messages)} messages):[/bold]")
-        for msg in messages:
-            _print_history_message(msg)
-        console.print()
 
-    run_async(_get())
+# Message types that carry a structured payload for the user rather than text.
+_FORM_TYPES = frozenset({
+    "session:form_to_user", "session:ask_for_location",
+    "session:three_way_call", "session:interactive_auth_confirmation",
+})
 
 
-def _print_history_message(msg):
-    """Render a single history message."""
-    meta = msg.get("metadata", {})
-    source = meta.get("source", {})
-    role = source.get("role", "unknown")
-    ts = meta.get("timestamp", "")
+def _heading(label: str, style: str, fts: str, note: str = ""):
+    from rich.text import Text
+
+    return Text.assemble("\n", (label, style), "  ", (fts, "dim"), ("  " + note if note else "", "dim"))
+
+
+def _body(content: str):
+    from rich.padding import Padding
+    from rich.text import Text
+
+    return Padding(Text(content), (0, 0, 0, 2), expand=False)
+
+
+def _render_user_message(msg_type: str, role: str, data: dict, fts: str) -> list:
+    if role != "user":
+        return []
+    content = data.get("content", "")
+    return [_heading("You", "bold cyan", fts)] + ([_body(content)] if content else [])
+
+
+def _render_text(msg_type: str, role: str, data: dict, fts: str) -> list:
+    content = data.get("content", "")
+    return [_heading("Pine AI", "bold green", fts)] + ([_body(content)] if content else [])
+
+
+def _render_work_log(msg_type: str, role: str, data: dict, fts: str) -> list:
+    out = []
+    for step in data.get("steps", []):
+        details = step.get("step_details", "")
+        if details:
+            out.append(_heading("Pine AI", "bold green", fts, f"({step.get('step_title', '')})"))
+            out.append(_body(details))
+    return out
+
+
+def _render_form(msg_type: str, role: str, data: dict, fts: str) -> list:
+    return [_heading(f"Pine AI ({msg_type})", "bold yellow", fts), _body(dumps(data, indent=True))]
+
+
+_HISTORY_RENDERERS = {
+    "session:message": _render_user_message,
+    "session:text": _render_text,
+    "session:work_log": _render_work_log,
+    **dict.fromkeys(_FORM_TYPES, _render_form),
+}
+
+
+def _render_history_message(msg) -> list:
+    """Render a single history message as a list of renderables."""
     msg_type = msg.get("type", "")
-    payload = msg.get("payload", {})
-    data = payload.get("data", {}) if isinstance(payload.get("data"), dict) else {}
-
-    fts = format_timestamp(ts)
-
-    if msg_type == "session:message" and role == "user":
-        content = data.get("content", "")
-        console.print(f"\n[bold cyan]You[/bold cyan]  [dim]{fts}[/dim]")
-        if content:
-            console.print(f"  {content}")
-    elif msg_type == "session:text":
-        content = data.get("content", "")
-        console.print(f"\n[bold green]Pine AI[/bold green]  [dim]{fts}[/dim]")
-        if content:
-            console.print(f"  {content}")
-    elif msg_type == "session:work_log":
-        steps = data.get("steps", [])
-        for step in steps:
-            details = step.get("step_details", "")
-            title = step.get("step_title", "")
-            if details:
-                console.print(f"\n[bold green]Pine AI[/bold green]  [dim]{fts}[/dim]  [dim]({title})[/dim]")
-                console.print(f"  {details}")
-    elif msg_type in ("session:form_to_user", "session:ask_for_location",
-                      "session:three_way_call", "session:interactive_auth_confirmation"):
-        console.print(f"\n[bold yellow]Pine AI ({msg_type})[/bold yellow]  [dim]{fts}[/dim]")
-        console.print(f"  {json.dumps(data, indent=2)}")
+    renderer = _HISTORY_RENDERERS.get(msg_type)
+    if renderer is None:
+        return []
+    meta = msg.get("metadata", {})
+    role = meta.get("source", {}).get("role", "unknown")
+    data = msg.get("payload", {}).get("data")
+    return renderer(msg_type, role, data if isinstance(data, dict) else {}, format_timestamp(meta.get("timestamp", "")))
+
+
+def _history_group(messages):
+    """Render a list of history messages as one Group."""
+    from rich.console import Group
+
+    return Group(*(r for msg in messages for r in _render_history_message(msg)))
 
 
 @sessions.command("create")
@@ -143,10 +236,10 @@ def sessions_create(json_output):
     """Create a new session."""
     async def _create():
         client = get_assistant_client()
-        with console.status("Creating session…"):
+        with maybe_status("Creating session…", json_output):
             session = await client.sessions.create()
         if json_output:
-            click.echo(json.dumps(session, indent=2))
+            emit_json(session, indent=True)
         else:
             console.print(f"[green]✓ Session created:[/green]  [bold]{session['id']}[/bold]")
             console.print(f"[dim]URL: https://www.19pine.ai/app/chat/{session['id']}[/dim]")
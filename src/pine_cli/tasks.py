@@ -1,11 +1,8 @@
 """pine task start|stop — task lifecycle commands."""
 
 import click
-from rich.console import Console
 
-from pine_cli.config import get_assistant_client, run_async, handle_api_errors
-
-console = Console()
+from pine_cli.config import console, emit_json, get_assistant_client, maybe_status, run_async, handle_api_errors
 
 
 @click.group()
@@ -15,13 +12,17 @@ def task():
 
 @task.command("start")
 @click.argument("session_id")
+@click.option("--json-output", "--json", is_flag=True, help="Output as JSON")
 @handle_api_errors
-def task_start(session_id):
+def task_start(session_id, json_output):
     """Start task execution for a session."""
     async def _start():
         client = get_assistant_client()
-        with console.status("Starting task…"):
+        with maybe_status("Starting task…", json_output):
             result = await client.sessions.start_task(session_id)
+        if json_output:
+            emit_json(result, indent=True)
+            return
         console.print(f"[green]✓ Task started[/green]  {result.get('message', 'OK')}")
 
     run_async(_start())
@@ -29,13 +30,17 @@ def task_start(session_id):
 
 @task.command("stop")
 @click.argument("session_id")
+@click.option("--json-output", "--json", is_flag=True, help="Output as JSON")
 @handle_api_errors
-def task_stop(session_id):
+def task_stop(session_id, json_output):
     """Stop a running task."""
     async def _stop():
         client = get_assistant_client()
-        with console.status("Stopping task…"):
+        with maybe_status("Stopping task…", json_output):
             result = await client.sessions.stop_task(session_id)
+        if json_output:
+            emit_json(result, indent=True)
+            return
         console.print(f"[green]✓ Task stopped[/green]  {result.get('message', 'OK')}")
 
     run_async(_stop())
@@ -1,17 +1,12 @@
 """pine voice call|status — Pine AI voice calls."""
 
-import json
-from contextlib import nullcontext
+import asyncio
+import time
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from pine_cli.config import get_voice_client, handle_api_errors
-
-console = Console()
+from pine_cli.config import console, emit_json, get_voice_client, maybe_status, run_async, handle_api_errors
 
 
 @click.group()
@@ -38,45 +33,53 @@ def voice():
 def call_cmd(phone, name, context, objective, instructions, caller, voice_gender,
              max_duration, summary, wait, json_output):
     """Make a phone call via Pine AI voice agent."""
-    client = get_voice_client()
-
-    call_kwargs = dict(
-        to=phone, name=name, context=context, objective=objective,
-        instructions=instructions, caller=caller, voice=voice_gender,
-        max_duration_minutes=max_duration, enable_summary=summary,
+    options = (
+        ("to", phone), ("name", name), ("context", context), ("objective", objective),
+        ("instructions", instructions), ("caller", caller), ("voice", voice_gender),
+        ("max_duration_minutes", max_duration), ("enable_summary", summary),
     )
-    call_kwargs = {k: v for k, v in call_kwargs.items() if v is not None}
-
-    if not wait:
-        with console.status("Initiating call…"):
-            initiated = client.calls.create(**call_kwargs)
-        if json_output:
-            click.echo(json.dumps({"call_id": initiated.call_id, "status": initiated.status}))
-        else:
-            console.print(f"[green]✓ Call initiated[/green]  ID: [bold]{initiated.call_id}[/bold]")
-            console.print(f"[dim]Check status: pine voice status {initiated.call_id}[/dim]")
-        return
+    call_kwargs = {k: v for k, v in options if v is not None}
+
+    async def _call():
+        client = get_voice_client()
+
+        if not wait:
+            with maybe_status("Initiating call…", json_output):
+                initiated = await client.calls.create(**call_kwargs)
+            if json_output:
+                emit_json({"call_id": initiated.call_id, "status": initiated.status})
+            else:
+                console.print(f"[green]✓ Call initiated[/green]  ID: [bold]{initiated.call_id}[/bold]")
+                console.print(f"[dim]Check status: pine voice status {initiated.call_id}[/dim]")
+            return
+
+        def _on_progress(progress):
+            if not json_output:
+                dur = f" ({progress.duration_seconds}s)" if progress.duration_seconds else ""
+                console.print(f"[dim]  ● {progress.status}{dur}[/dim]")
 
-    def _on_progress(progress):
         if not json_output:
-            dur = f" ({progress.duration_seconds}s)" if progress.duration_seconds else ""
-            console.print(f"[dim]  ● {progress.status}{dur}[/dim]")
+            console.print(f"[cyan]Calling {name} at {phone}…[/cyan]")
+        with maybe_status("Call in progress…", json_output) as status:
+            ticker = asyncio.create_task(_show_elapsed(status, "Call in progress…")) if status else None
+            try:
+                result = await client.calls.create_and_wait(**call_kwargs, on_progress=_on_progress)
+            finally:
+                if ticker:
+                    ticker.cancel()
 
-    if not json_output:
-        console.print(f"[cyan]Calling {name} at {phone}…[/cyan]")
-    with console.status("Call in progress…") if not json_output else nullcontext():
-        result = client.calls.create_and_wait(**call_kwargs, on_progress=_on_progress)
+        if json_output:
+            emit_json({
+                "call_id": result.call_id, "status": result.status,
+                "duration_seconds": result.duration_seconds,
+                "summary": result.summary, "credits_charged": result.credits_charged,
+                "transcript": result.transcript,
+            }, indent=True)
+            return
 
-    if json_output:
-        click.echo(json.dumps({
-            "call_id": result.call_id, "status": result.status,
-            "duration_seconds": result.duration_seconds,
-            "summary": result.summary, "credits_charged": result.credits_charged,
-            "transcript": [{"speaker": t.speaker, "text": t.text} for t in result.transcript],
-        }, indent=2))
-        return
+        _render_result(result)
 
-    _render_result(result)
+    run_async(_call())
 
 
 @voice.command("status")
@@ -85,33 +88,48 @@ def call_cmd(phone, name, context, objective, instructions, caller, voice_gender
 @handle_api_errors
 def status_cmd(call_id, json_output):
     """Check the status of a voice call."""
-    client = get_voice_client()
+    async def _status():
+        client = get_voice_client()
 
-    with console.status("Fetching call status…"):
-        result = client.calls.get(call_id)
+        with maybe_status("Fetching call status…", json_output):
+            result = await client.calls.get(call_id)
+
+        if json_output:
+            data = {"call_id": result.call_id, "status": result.status}
+            if hasattr(result, "summary"):
+                data.update(
+                    duration_seconds=result.duration_seconds,
+                    summary=result.summary,
+                    credits_charged=result.credits_charged,
+                    transcript=result.transcript,
+                )
+            emit_json(data, indent=True)
+            return
 
-    if json_output:
-        data = {"call_id": result.call_id, "status": result.status}
         if hasattr(result, "summary"):
-            data.update(
-                duration_seconds=result.duration_seconds,
-                summary=result.summary,
-                credits_charged=result.credits_charged,
-                transcript=[{"speaker": t.speaker, "text": t.text} for t in result.transcript],
-            )
-        click.echo(json.dumps(data, indent=2))
-        return
-
-    if hasattr(result, "summary"):
-        _render_result(result)
-    else:
-        console.print(f"Call [bold]{result.call_id}[/bold]  Status: [yellow]{result.status}[/yellow]")
-        if result.duration_seconds:
-            console.print(f"Duration: {result.duration_seconds}s")
+            _render_result(result)
+        else:
+            console.print(f"Call [bold]{result.call_id}[/bold]  Status: [yellow]{result.status}[/yellow]")
+            if result.duration_seconds:
+                console.print(f"Duration: {result.duration_seconds}s")
+
+    run_async(_status())
+
+
+async def _show_elapsed(status, label: str):
+    """Keep a status spinner's text showing how long it has been running."""
+    start = time.monotonic()
+    while True:
+        await asyncio.sleep(1)
+        secs = int(time.monotonic() - start)
+        status.update(f"{label} {secs // 60}:{secs % 60:02d}")
 
 
 def _render_result(result):
     """Pretty-print a completed CallResult."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     color = {"completed": "green", "failed": "red", "cancelled": "yellow"}.get(result.status, "white")
     console.print(f"\n[{color} bold]{result.status.upper()}[/{color} bold]  "
                   f"Call [bold]{result.call_id}[/bold]")